@@ -5,6 +5,7 @@ Django Base Settings
 
 from pathlib import Path
 from decouple import config, Csv
+from django.core.exceptions import ImproperlyConfigured
 import os
 
 # Build paths
@@ -107,6 +108,90 @@ else:
         }
     }
 
+# ========================================
+# 缓存配置
+# ========================================
+# 设置 USE_REDIS=True 使用 Redis（多进程共享），否则使用进程内 LocMemCache（仅限开发、测试）
+# 未读计数、响应缓存、ETag 版本号都存放在缓存中，多进程部署各进程必须看到同一份，
+# 因此 DEBUG 关闭时必须启用 Redis
+USE_REDIS = config('USE_REDIS', default=not DEBUG, cast=bool)
+if not DEBUG and not USE_REDIS:
+    raise ImproperlyConfigured('DJANGO_DEBUG=False 时必须设置 USE_REDIS=True：进程内缓存无法在多个 worker 之间共享')
+
+REDIS_URL = "redis://{}:{}/{}".format(
+    config('REDIS_HOST', default='localhost'),
+    config('REDIS_PORT', default=6379, cast=int),
+    config('REDIS_DB', default=0, cast=int),
+)
+REDIS_PASSWORD = config('REDIS_PASSWORD', default='')
+
+# shared: 必须在所有进程间一致的状态（分组版本号与缓存的响应，见 lovezs/caching.py）
+# 启用 Redis 时与 default 指向同一个 Redis；开发环境为单进程，使用独立的 LocMemCache
+# 启动时由 lovezs/checks.py 检查 Redis 是否可以连接
+if USE_REDIS:
+    CACHES = {
+        "default": {
+            "BACKEND": "django_redis.cache.RedisCache",
+            "LOCATION": REDIS_URL,
+            "KEY_PREFIX": "lovezs",
+            "OPTIONS": {
+                "CLIENT_CLASS": "django_redis.client.DefaultClient",
+                "PASSWORD": REDIS_PASSWORD or None,
+                # Redis 不可用时降级为缓存未命中，接口回退到数据库查询
+                "IGNORE_EXCEPTIONS": True,
+            },
+        },
+        "shared": {
+            "BACKEND": "django_redis.cache.RedisCache",
+            "LOCATION": REDIS_URL,
+            "KEY_PREFIX": "lovezs",
+            "OPTIONS": {
+                "CLIENT_CLASS": "django_redis.client.DefaultClient",
+                "PASSWORD": REDIS_PASSWORD or None,
+                # 版本号读不到时不能当作未命中（会返回过期的 ETag 和缓存响应），Redis 故障直接报错
+                "IGNORE_EXCEPTIONS": False,
+            },
+        },
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "lovezs",
+        },
+        "shared": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "lovezs-shared",
+        },
+    }
+
+# 未读通知计数缓存有效期（秒），过期后从数据库重新统计，修正计数漂移
+NOTIFICATION_UNREAD_CACHE_TTL = config('NOTIFICATION_UNREAD_CACHE_TTL', default=300, cast=int)
+
+# 读多写少接口（日记分类、标签、重要日列表、照片地图）的响应缓存，数据变更时由信号主动失效
+# 只有 Redis 能保证各 worker 看到同一份缓存，未启用 Redis 时默认关闭
+RESPONSE_CACHE_ENABLED = config('RESPONSE_CACHE_ENABLED', default=USE_REDIS, cast=bool)
+RESPONSE_CACHE_TTL = config('RESPONSE_CACHE_TTL', default=600, cast=int)
+
+# 日记列表每篇附带的照片预览数量（photo_preview 字段）
+DIARY_LIST_PHOTO_PREVIEW = config('DIARY_LIST_PHOTO_PREVIEW', default=3, cast=int)
+
+# 通知实时推送（SSE）
+# 启用 Redis 时默认使用 lovezs.realtime.RedisBroker；进程内代理只能送达同一进程的连接，
+# 其他进程写入的通知要等心跳时从数据库补齐，因此 DEBUG 关闭（多 worker 部署）时不允许使用
+NOTIFICATION_BROKER = config(
+    'NOTIFICATION_BROKER',
+    default='lovezs.realtime.RedisBroker' if USE_REDIS else 'lovezs.realtime.InProcessBroker',
+)
+if not DEBUG and NOTIFICATION_BROKER == 'lovezs.realtime.InProcessBroker':
+    raise ImproperlyConfigured('DJANGO_DEBUG=False 时 NOTIFICATION_BROKER 必须是跨进程代理（lovezs.realtime.RedisBroker）')
+# 心跳间隔（秒），同时是跨进程补齐的最大延迟
+NOTIFICATION_STREAM_HEARTBEAT = config('NOTIFICATION_STREAM_HEARTBEAT', default=15, cast=int)
+# 单个连接的最长保持时间（秒），到期后由 EventSource 自动重连
+NOTIFICATION_STREAM_MAX_AGE = config('NOTIFICATION_STREAM_MAX_AGE', default=300, cast=int)
+# 连接票据有效期（秒），只在建立连接时校验
+NOTIFICATION_STREAM_TICKET_MAX_AGE = config('NOTIFICATION_STREAM_TICKET_MAX_AGE', default=60, cast=int)
+
 # ========================================
 # 密码验证
 # ========================================
@@ -147,9 +232,37 @@ MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media" / "uploads"
 
 # 文件上传限制
-FILE_UPLOAD_MAX_MEMORY_SIZE = config('MAX_UPLOAD_SIZE', default=104857600, cast=int)  # 100MB
+# 超过 FILE_UPLOAD_MAX_MEMORY_SIZE 的上传文件（以及 ASGI 下的请求体）写入临时文件，不占用进程内存
+FILE_UPLOAD_MAX_MEMORY_SIZE = config('FILE_UPLOAD_MAX_MEMORY_SIZE', default=2621440, cast=int)  # 2.5MB
 DATA_UPLOAD_MAX_MEMORY_SIZE = config('MAX_UPLOAD_SIZE', default=104857600, cast=int)
 
+# 分片上传（断点续传）
+# 临时文件目录，多进程部署时需要所有进程共享
+CHUNKED_UPLOAD_DIR = BASE_DIR / config('CHUNKED_UPLOAD_DIR', default='media/incoming')
+# 单个分片的最大字节数
+CHUNKED_UPLOAD_MAX_CHUNK_SIZE = config('CHUNKED_UPLOAD_MAX_CHUNK_SIZE', default=8388608, cast=int)  # 8MB
+# 未完成的上传保留时长（小时），过期后由 purge_photo_uploads 命令清理
+CHUNKED_UPLOAD_EXPIRE_HOURS = config('CHUNKED_UPLOAD_EXPIRE_HOURS', default=24, cast=int)
+
+# 媒体后台任务（缩略图、压缩图）
+# thread: 进程内线程池（DEBUG 下默认）/ worker: 由 process_media_jobs 命令处理（生产环境默认，见 docker-compose.prod.yml 的 media-worker）
+# sync: 同步处理
+MEDIA_JOB_BACKEND = config('MEDIA_JOB_BACKEND', default='thread' if DEBUG else 'worker')
+MEDIA_JOB_WORKERS = config('MEDIA_JOB_WORKERS', default=2, cast=int)
+MEDIA_JOB_MAX_ATTEMPTS = config('MEDIA_JOB_MAX_ATTEMPTS', default=3, cast=int)
+# 失败重试的基础等待（秒），第 n 次失败后等待 基础值 × 2^(n-1)
+MEDIA_JOB_RETRY_DELAY = config('MEDIA_JOB_RETRY_DELAY', default=30, cast=int)
+
+# 响应式图片尺寸阶梯（宽度像素）与输出格式，AVIF 仅在 Pillow 支持时生成
+PHOTO_DERIVATIVE_WIDTHS = config('PHOTO_DERIVATIVE_WIDTHS', default='200,400,800,1600', cast=Csv(int))
+PHOTO_DERIVATIVE_FORMATS = config('PHOTO_DERIVATIVE_FORMATS', default='webp,avif', cast=Csv())
+
+# 近似重复照片的默认判定距离（64 位 dHash 的汉明距离，最大 11）
+PHOTO_NEAR_DUPLICATE_DISTANCE = config('PHOTO_NEAR_DUPLICATE_DISTANCE', default=6, cast=int)
+
+# 照片地图单次返回的聚合点上限
+PHOTO_MAP_MAX_CLUSTERS = config('PHOTO_MAP_MAX_CLUSTERS', default=200, cast=int)
+
 # ========================================
 # Django REST Framework 配置
 # ========================================
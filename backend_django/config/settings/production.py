@@ -11,6 +11,10 @@ from decouple import config
 # ========================================
 DEBUG = False
 
+# 多 worker 部署共享缓存（见 base.py 缓存配置）
+if not USE_REDIS:
+    raise ImproperlyConfigured('生产环境必须设置 USE_REDIS=True')
+
 # ========================================
 # 安全配置
 # ========================================